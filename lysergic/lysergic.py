@@ -1,5 +1,6 @@
 import os
 import hashlib
+import importlib.util
 import json
 import gzip
 from typing import Dict, Iterator, List
@@ -7,10 +8,25 @@ import random
 import statistics
 import time
 import concurrent.futures
+import threading
 from pathlib import Path
 
 from tqdm import tqdm
 
+_worker_lsd = None
+
+
+def _init_worker(cls: type, config: Dict) -> None:
+    # Build one LSD per worker process so setup cost (e.g. loading Magika)
+    # is paid once per process rather than once per file. The caller's
+    # class is used so subclass overrides also apply in process mode.
+    global _worker_lsd
+    _worker_lsd = cls(**config)
+
+
+def _process_file(file_path: str) -> Dict[str, str]:
+    return _worker_lsd.get_file_properties(file_path)
+
 
 class LSD:
     BUFFER_SIZE = 1024 * 1024
@@ -25,6 +41,7 @@ class LSD:
         show_progress: bool = True,
         salt: str = "",
         disable_hashing: bool = False,
+        num_processes: int = 1,
     ):
         self.directory = directory
         self.include_metadata = include_metadata
@@ -37,63 +54,65 @@ class LSD:
             False  # New attribute to track output destination
         )
         self.disable_hashing = disable_hashing
-
-        if self.use_magika:
-            try:
-                from magika import Magika
-
-                self.magika = Magika()
-            except ImportError:
-                raise ImportError(
-                    "Magika not found. Install with `pip install magika`"
-                )
+        self.num_processes = num_processes or os.cpu_count() or 1
+
+        if self.num_processes < 0:
+            raise ValueError("num_processes must be 0 or greater")
+        if self.num_threads > 1 and self.num_processes > 1:
+            raise ValueError("Use either multiple threads or processes")
+
+        # Magika is loaded on first use so that process mode only pays the
+        # model load in the workers that actually identify files
+        self._magika_lock = threading.Lock()
+        if self.use_magika and importlib.util.find_spec("magika") is None:
+            raise ImportError(
+                "Magika not found. Install with `pip install magika`"
+            )
+
+    @property
+    def salt(self) -> str:
+        return self._salt
+
+    @salt.setter
+    def salt(self, salt: str):
+        # Seed the hashers with the salt once; each file works on a copy
+        salt_bytes = salt.encode()
+        self._hash_templates = (
+            hashlib.md5(salt_bytes),
+            hashlib.sha1(salt_bytes),
+            hashlib.sha256(salt_bytes),
+        )
+        self._salt = salt
 
     def get_file_properties(self, file_path: str) -> Dict[str, str]:
         abs_path = os.path.join(self.directory, file_path)
-        file_size = os.path.getsize(abs_path)
+        stat = os.stat(abs_path)
 
         _, extension = os.path.splitext(file_path)
         extension = extension.lstrip(".").lower()
 
         result = {
             "relative_path": file_path,
-            "size": file_size,
+            "size": stat.st_size,
             "extension": extension,
         }
 
         if not self.disable_hashing:
-            md5 = hashlib.md5(self.salt.encode())
-            sha1 = hashlib.sha1(self.salt.encode())
-            sha256 = hashlib.sha256(self.salt.encode())
-
-            with open(abs_path, "rb") as f:
-                while True:
-                    chunk = f.read(self.BUFFER_SIZE)
-                    if not chunk:
-                        break
-                    md5.update(chunk)
-                    sha1.update(chunk)
-                    sha256.update(chunk)
-
-            result["hashes"] = {
-                "md5": md5.hexdigest(),
-                "sha1": sha1.hexdigest(),
-                "sha256": sha256.hexdigest(),
-            }
+            result["hashes"] = self.get_file_hashes(abs_path)
 
-        if self.magika:
-            magika_result = self.magika.identify_path(Path(abs_path))
+        if self.use_magika:
+            magika = self.get_magika()
+            output = magika.identify_path(Path(abs_path)).output
             result["magika"] = {
-                "ct_label": magika_result.output.ct_label,
-                "score": magika_result.output.score,
-                "group": magika_result.output.group,
-                "mime_type": magika_result.output.mime_type,
-                "magic": magika_result.output.magic,
-                "description": magika_result.output.description,
+                "ct_label": output.ct_label,
+                "score": output.score,
+                "group": output.group,
+                "mime_type": output.mime_type,
+                "magic": output.magic,
+                "description": output.description,
             }
 
         if self.include_metadata:
-            stat = os.stat(abs_path)
             result["metadata"] = {
                 "created": time.ctime(stat.st_ctime),
                 "last_modified": time.ctime(stat.st_mtime),
@@ -105,6 +124,33 @@ class LSD:
 
         return result
 
+    def get_file_hashes(self, abs_path: str) -> Dict[str, str]:
+        md5, sha1, sha256 = (h.copy() for h in self._hash_templates)
+
+        with open(abs_path, "rb") as f:
+            while True:
+                chunk = f.read(self.BUFFER_SIZE)
+                if not chunk:
+                    break
+                md5.update(chunk)
+                sha1.update(chunk)
+                sha256.update(chunk)
+
+        return {
+            "md5": md5.hexdigest(),
+            "sha1": sha1.hexdigest(),
+            "sha256": sha256.hexdigest(),
+        }
+
+    def get_magika(self):
+        if self.magika is None:
+            with self._magika_lock:
+                if self.magika is None:
+                    from magika import Magika
+
+                    self.magika = Magika()
+        return self.magika
+
     def count_files(self) -> int:
         return sum(len(files) for _, _, files in os.walk(self.directory))
 
@@ -117,6 +163,10 @@ class LSD:
         else:
             sample_files = random.sample(all_files, self.SAMPLE_SIZE)
 
+        # Load the model up front so it isn't timed as part of one sample
+        if self.use_magika:
+            self.get_magika()
+
         processing_times = []
         pbar = tqdm(
             sample_files,
@@ -147,19 +197,35 @@ class LSD:
             "error_margin": error_margin,
         }
 
-    def get_all_files(self) -> List[str]:
-        all_files = []
+    def iter_files(self) -> Iterator[str]:
         for root, _, files in os.walk(self.directory):
             for file in files:
-                all_files.append(
-                    os.path.relpath(os.path.join(root, file), self.directory)
-                )
-        return all_files
+                yield os.path.relpath(os.path.join(root, file), self.directory)
+
+    def get_all_files(self) -> List[str]:
+        return list(self.iter_files())
+
+    def _worker_config(self) -> Dict:
+        return {
+            "directory": self.directory,
+            "include_metadata": self.include_metadata,
+            "use_magika": self.use_magika,
+            "show_progress": False,
+            "salt": self.salt,
+            "disable_hashing": self.disable_hashing,
+        }
 
     def process_directory(self) -> Iterator[Dict[str, str]]:
-        all_files = self.get_all_files()
-        total_files = len(all_files)
         use_progress_bar = self.output_to_file and self.show_progress
+        parallel = self.num_processes > 1 or self.num_threads > 1
+
+        if use_progress_bar or parallel:
+            all_files = self.get_all_files()
+            total_files = len(all_files)
+        else:
+            # Nothing needs the total, so start on files as they are found
+            all_files = self.iter_files()
+            total_files = None
 
         with tqdm(
             total=total_files,
@@ -167,7 +233,20 @@ class LSD:
             unit="file",
             disable=not use_progress_bar,
         ) as pbar:
-            if self.num_threads > 1:
+            if self.num_processes > 1:
+                chunksize = max(1, total_files // (self.num_processes * 4))
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.num_processes,
+                    initializer=_init_worker,
+                    initargs=(type(self), self._worker_config()),
+                ) as executor:
+                    for result in executor.map(
+                        _process_file, all_files, chunksize=chunksize
+                    ):
+                        yield result
+                        if use_progress_bar:
+                            pbar.update(1)
+            elif self.num_threads > 1:
                 with concurrent.futures.ThreadPoolExecutor(
                     max_workers=self.num_threads
                 ) as executor:
@@ -242,6 +321,13 @@ def main():
         default=1,
         help="Number of threads to use (default: 1)",
     )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        help="Number of processes to use (default: 1, 0 for all CPUs)",
+    )
     parser.add_argument(
         "--magika",
         action="store_true",
@@ -266,6 +352,11 @@ def main():
     )
     args = parser.parse_args()
 
+    if args.processes < 0:
+        parser.error("--processes must be 0 or greater")
+    if args.threads > 1 and args.processes != 1:
+        parser.error("--threads and --processes cannot be combined")
+
     lsd = LSD(
         args.directory,
         args.metadata,
@@ -274,6 +365,7 @@ def main():
         not args.no_progress,
         args.salt,
         args.disable_hashing,
+        args.processes,
     )
 
     if args.eta:
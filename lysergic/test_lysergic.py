@@ -4,6 +4,12 @@ import tempfile
 import shutil
 import random
 import json
+import hashlib
+import importlib.util
+import sys
+import threading
+import types
+from unittest import mock
 
 from lysergic import LSD
 
@@ -45,6 +51,33 @@ def create_complex_test_directory(
     return dirs, created_files
 
 
+class TaggedLSD(LSD):
+    def get_file_properties(self, file_path):
+        result = super().get_file_properties(file_path)
+        result["tagged"] = True
+        return result
+
+
+class FakeMagika:
+    instances = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        with FakeMagika.lock:
+            FakeMagika.instances += 1
+
+    def identify_path(self, path):
+        output = types.SimpleNamespace(
+            ct_label="unknown",
+            score=1.0,
+            group="unknown",
+            mime_type="application/octet-stream",
+            magic="data",
+            description="Unknown binary data",
+        )
+        return types.SimpleNamespace(output=output)
+
+
 class TestLSDClass(unittest.TestCase):
 
     @classmethod
@@ -75,6 +108,28 @@ class TestLSDClass(unittest.TestCase):
         self.assertIn("sha1", result["hashes"])
         self.assertIn("sha256", result["hashes"])
 
+    def test_get_file_properties_with_salt(self):
+        test_file = self.created_files[0]
+        relative_path = os.path.relpath(test_file, self.temp_dir)
+        with open(test_file, "rb") as f:
+            data = f.read()
+
+        salted = LSD(self.temp_dir, show_progress=False, salt="pepper")
+        for _ in range(2):
+            result = salted.get_file_properties(relative_path)
+            self.assertEqual(
+                result["hashes"]["sha256"],
+                hashlib.sha256(b"pepper" + data).hexdigest(),
+            )
+
+        # Changing the salt after construction must reseed the hashers
+        salted.salt = "cumin"
+        result = salted.get_file_properties(relative_path)
+        self.assertEqual(
+            result["hashes"]["sha256"],
+            hashlib.sha256(b"cumin" + data).hexdigest(),
+        )
+
     def test_get_file_properties_with_metadata(self):
         test_file = self.created_files[0]
         relative_path = os.path.relpath(test_file, self.temp_dir)
@@ -137,6 +192,79 @@ class TestLSDClass(unittest.TestCase):
             )
         )
 
+    def test_process_directory_with_processes(self):
+        lsd = LSD(self.temp_dir, show_progress=False, num_processes=2)
+        results = list(lsd.process_directory())
+        self.assertEqual(len(results), 150)
+
+        # Results should match the single process run
+        expected = {
+            r["relative_path"]: r for r in self.lsd.process_directory()
+        }
+        for result in results:
+            self.assertEqual(result, expected[result["relative_path"]])
+
+    def test_process_directory_with_processes_subclass(self):
+        lsd = TaggedLSD(self.temp_dir, show_progress=False, num_processes=2)
+        results = list(lsd.process_directory())
+        self.assertTrue(all(result["tagged"] for result in results))
+
+    def _patch_magika(self):
+        real_find_spec = importlib.util.find_spec
+
+        def find_spec(name, *args, **kwargs):
+            if name == "magika":
+                return mock.sentinel.spec
+            return real_find_spec(name, *args, **kwargs)
+
+        FakeMagika.instances = 0
+        fake_module = types.ModuleType("magika")
+        fake_module.Magika = FakeMagika
+        patches = [
+            mock.patch("importlib.util.find_spec", find_spec),
+            mock.patch.dict(sys.modules, {"magika": fake_module}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_magika_loaded_once_on_first_use(self):
+        self._patch_magika()
+        lsd = LSD(
+            self.temp_dir, use_magika=True, num_threads=4, show_progress=False
+        )
+        self.assertIsNone(lsd.magika)
+        self.assertEqual(FakeMagika.instances, 0)
+
+        results = list(lsd.process_directory())
+        self.assertEqual(len(results), 150)
+        self.assertTrue(all("magika" in result for result in results))
+        self.assertEqual(FakeMagika.instances, 1)
+
+    def test_estimate_processing_time_loads_magika_first(self):
+        self._patch_magika()
+        lsd = LSD(self.temp_dir, use_magika=True, show_progress=False)
+        get_file_properties = lsd.get_file_properties
+
+        def timed_get_file_properties(file_path):
+            # The model must already be loaded when a sample is timed
+            self.assertIsNotNone(lsd.magika)
+            return get_file_properties(file_path)
+
+        lsd.get_file_properties = timed_get_file_properties
+        lsd.estimate_processing_time()
+        self.assertEqual(FakeMagika.instances, 1)
+
+    def test_threads_and_processes_rejected(self):
+        with self.assertRaises(ValueError):
+            LSD(self.temp_dir, num_threads=2, num_processes=2)
+
+    def test_num_processes(self):
+        lsd = LSD(self.temp_dir, num_processes=0)
+        self.assertEqual(lsd.num_processes, os.cpu_count())
+        with self.assertRaises(ValueError):
+            LSD(self.temp_dir, num_processes=-1)
+
     def test_save_to_jsonl(self):
         test_data = [{"key1": "value1"}, {"key2": "value2"}]
         test_output = os.path.join(self.temp_dir, "test_output.jsonl")